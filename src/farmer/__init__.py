@@ -10,8 +10,7 @@ __author__ = "Gopal Bhingewad"
 __email__ = "gopal@example.com"
 __description__ = "AI Agriculture Assistant for Farmers"
 
-from .app import create_app
-from .config.settings import get_config, config
+from .config import get_config
 from .config.logging_config import setup_logging, get_logger
 
 __all__ = [
@@ -22,6 +21,15 @@ __all__ = [
     'get_logger'
 ]
 
+def __getattr__(name):
+    """Import the Flask application factory on first access"""
+    if name == 'create_app':
+        from .app import create_app
+        return create_app
+    if name == 'config':
+        return get_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 # Initialize logging when package is imported
 logger = get_logger(__name__)
-logger.info(f"Farmer AI Agriculture Assistant v{__version__} initialized")
+logger.debug("Farmer AI Agriculture Assistant v%s initialized", __version__)
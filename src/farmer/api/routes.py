@@ -1,8 +1,8 @@
 """
 API routes for Farmer AI Agriculture Assistant
 """
-from flask import Blueprint, request, jsonify, current_app
-from datetime import datetime
+import orjson
+from flask import Blueprint, Response, request, jsonify, current_app, g
 import logging
 
 # Create blueprint
@@ -11,28 +11,34 @@ api_bp = Blueprint('api', __name__, url_prefix='/api/v1')
 # Get logger
 logger = logging.getLogger(__name__)
 
+# Pre-encoded health check body, completed with the request timestamp
+_HEALTH_BODY_HEAD = b'{"status":"healthy","service":"Farmer AI Agriculture Assistant","timestamp":"'
+
 @api_bp.route('/health', methods=['GET'])
 def health_check():
     """Health check endpoint"""
     try:
-        return jsonify({
-            'status': 'healthy',
-            'timestamp': datetime.utcnow().isoformat(),
-            'service': 'Farmer AI Agriculture Assistant'
-        }), 200
+        body = _HEALTH_BODY_HEAD + g.ts.encode('ascii') + b'"}'
+        return Response(body, status=200, mimetype='application/json')
     except Exception as e:
-        logger.error(f"Health check failed: {e}")
+        logger.error("Health check failed: %s", e)
         return jsonify({
             'status': 'unhealthy',
             'error': str(e),
-            'timestamp': datetime.utcnow().isoformat()
+            'timestamp': g.ts
         }), 500
 
 @api_bp.route('/chat', methods=['POST'])
 def chat():
     """Chat endpoint for AI responses"""
     try:
-        data = request.get_json()
+        raw = request.get_data(cache=False)
+        if not raw:
+            return jsonify({'error': 'No data provided'}), 400
+        try:
+            data = orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            return jsonify({'error': 'Invalid JSON'}), 400
         if not data:
             return jsonify({'error': 'No data provided'}), 400
         
@@ -43,18 +49,18 @@ def chat():
         # TODO: Implement actual chat logic
         response = f"Echo: {message}"
         
-        logger.info(f"Chat request processed: {message[:50]}...")
+        logger.info("Chat request processed: %s...", message[:50])
         
         return jsonify({
             'response': response,
-            'timestamp': datetime.utcnow().isoformat()
+            'timestamp': g.ts
         }), 200
         
     except Exception as e:
-        logger.error(f"Chat endpoint error: {e}")
+        logger.error("Chat endpoint error: %s", e)
         return jsonify({
             'error': 'Internal server error',
-            'timestamp': datetime.utcnow().isoformat()
+            'timestamp': g.ts
         }), 500
 
 @api_bp.route('/upload', methods=['POST'])
@@ -68,18 +74,25 @@ def upload_file():
         if file.filename == '':
             return jsonify({'error': 'No file selected'}), 400
         
+        # The app's UploadRequest already wrote the file into the upload directory
+        path = request.upload_path(file)
+        if path is None:
+            return jsonify({'error': 'File type not allowed'}), 400
+        saved_name = path.name
+        
         # TODO: Implement file processing logic
-        logger.info(f"File upload: {file.filename}")
+        logger.info("File upload: %s saved as %s", file.filename, saved_name)
         
         return jsonify({
             'message': 'File uploaded successfully',
             'filename': file.filename,
-            'timestamp': datetime.utcnow().isoformat()
+            'saved_as': saved_name,
+            'timestamp': g.ts
         }), 200
         
     except Exception as e:
-        logger.error(f"Upload endpoint error: {e}")
+        logger.error("Upload endpoint error: %s", e)
         return jsonify({
             'error': 'Internal server error',
-            'timestamp': datetime.utcnow().isoformat()
+            'timestamp': g.ts
         }), 500
@@ -3,37 +3,188 @@ Main Flask application factory for the Farmer AI Agriculture Assistant
 """
 import os
 import time
+import hashlib
+import itertools
+from types import MappingProxyType
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import IO, Optional, Dict, Any, List, Set, Tuple
 from pathlib import Path
 
-from flask import Flask, request, g, jsonify, render_template
-from flask_sqlalchemy import SQLAlchemy
+import orjson
+from flask import Flask, Request, Response, current_app, request, g, jsonify, render_template
+from flask.json.provider import DefaultJSONProvider
 from werkzeug.middleware.proxy_fix import ProxyFix
+from werkzeug.datastructures import FileStorage
 from werkzeug.utils import secure_filename
 
-from .config.settings import get_config, config
-from .config.logging_config import get_logger, setup_logging, log_api_request, log_api_response
-from .models import Base
-from .api.routes import api_bp
-from .core.database import init_db
-from .core.redis_client import init_redis
-from .core.middleware import setup_middleware
+from .config.settings import get_config, get_config_by_env
+from .config.logging_config import get_logger, setup_logging, log_api_request, buffer_api_response
 
 logger = get_logger(__name__)
 
+# Batched access lines; setup_logging sends them to the app log file only
+access_logger = get_logger('farmer.access')
+
+# Template variables for the main application page
+INDEX_TEMPLATE_VARS = MappingProxyType({
+    'languages': MappingProxyType({
+        'en': 'English',
+        'es': 'Español',
+        'fr': 'Français',
+        'de': 'Deutsch',
+        'hi': 'हिंदी',
+        'zh': '中文',
+        'ar': 'العربية'
+    }),
+    'app_name': 'Farmer AI',
+    'app_description': 'Your AI Agriculture Assistant'
+})
+
+# Buffer size used when streaming uploads to disk
+UPLOAD_BUFFER_SIZE = 1024 * 1024
+
+# Mock payloads, encoded once at import. *_SUFFIX is the encoded object after
+# its opening brace and *_PREFIX the object before its closing brace (each
+# with the joining comma), so _json_response can splice in request fields.
+_MOCK_WEATHER_SUFFIX = b',' + orjson.dumps({
+    'temperature': 25,
+    'description': 'Sunny',
+    'humidity': 65,
+    'wind_speed': 12
+})[1:]
+
+_MOCK_CROPS_PREFIX = orjson.dumps({
+    'weather': {
+        'temperature': 28,
+        'humidity': 70
+    },
+    'recommendations': [
+        'Wheat - Good for current conditions',
+        'Corn - Suitable for your soil type',
+        'Soybeans - Recommended for this season'
+    ]
+})[:-1] + b','
+
+_MOCK_MARKET_PRICES_JSON = orjson.dumps({
+    'wheat': {'price': '$5.50/bushel', 'trend': '↗️ +2.3%'},
+    'corn': {'price': '$4.20/bushel', 'trend': '↘️ -1.1%'},
+    'soybeans': {'price': '$12.80/bushel', 'trend': '↗️ +0.8%'},
+    'rice': {'price': '$18.50/hundredweight', 'trend': '→ 0.0%'}
+})
+
+# Pre-encoded body for the liveness probe
+_HEALTH_BODY = b'{"status":"healthy","service":"Farmer AI Agriculture Assistant"}'
+
+def _json_response(prefix: bytes, fields: Dict[str, Any], suffix: bytes) -> Response:
+    """Build a JSON response by encoding fields between pre-encoded object parts"""
+    body = b','.join(orjson.dumps(key) + b':' + orjson.dumps(value) for key, value in fields.items())
+    return Response(prefix + body + suffix, mimetype='application/json')
+
+# Probe endpoints excluded from request/response logging
+_NOLOG_PATHS = frozenset({'/health', '/api/v1/health'})
+
+# Counters keeping upload names and request IDs unique within a clock tick
+_upload_counter = itertools.count()
+_request_counter = itertools.count()
+
+# Endpoints whose multipart file parts are written straight to the upload directory
+DIRECT_UPLOAD_ENDPOINTS = frozenset({'chat', 'api.upload_file'})
+
+def _upload_opener(path: str, flags: int) -> int:
+    """Open upload targets with fixed 0644 permissions"""
+    return os.open(path, flags, 0o644)
+
+def _allowed_upload(filename: str) -> bool:
+    """Check an uploaded filename's extension against the app's allowed extensions"""
+    return os.path.splitext(filename)[1].lower() in current_app.config['ALLOWED_EXTENSIONS_DOTTED']
+
+class UploadRequest(Request):
+    """
+    Request that streams uploaded files directly to their final location
+    
+    For DIRECT_UPLOAD_ENDPOINTS, each named file part with an allowed
+    extension is written once into the upload directory while the form is
+    parsed, instead of being spooled to a temporary file and copied. Other
+    parts are spooled as usual and never reach the upload directory.
+    Views claim the files they keep through upload_path(); unclaimed files,
+    and every file of a request that fails, are removed by discard_uploads().
+    """
+    
+    _saved_uploads: Optional[List[Tuple[IO[bytes], Path]]] = None
+    _claimed_uploads: Optional[Set[Path]] = None
+    
+    def _get_file_stream(
+        self,
+        total_content_length: Optional[int],
+        content_type: Optional[str],
+        filename: Optional[str] = None,
+        content_length: Optional[int] = None
+    ) -> IO[bytes]:
+        """Open the destination file for an uploaded file part"""
+        if not filename or self.endpoint not in DIRECT_UPLOAD_ENDPOINTS or not _allowed_upload(filename):
+            return super()._get_file_stream(total_content_length, content_type, filename, content_length)
+        
+        name = f"{time.time_ns()}_{next(_upload_counter)}_{secure_filename(filename)}"
+        path = current_app.extensions['upload_dir'] / name
+        stream = open(path, 'w+b', buffering=UPLOAD_BUFFER_SIZE, opener=_upload_opener)
+        if self._saved_uploads is None:
+            self._saved_uploads = []
+        self._saved_uploads.append((stream, path))
+        return stream
+    
+    def upload_path(self, file: FileStorage) -> Optional[Path]:
+        """Claim the file a part was saved to and get its path, or None if it was not kept"""
+        for stream, path in self._saved_uploads or ():
+            if stream is file.stream:
+                if self._claimed_uploads is None:
+                    self._claimed_uploads = set()
+                self._claimed_uploads.add(path)
+                return path
+        return None
+    
+    def discard_uploads(self, unclaimed_only: bool = False) -> None:
+        """Close and delete the files saved for this request, or only those no view claimed"""
+        saved, self._saved_uploads = self._saved_uploads, None
+        claimed = (self._claimed_uploads or ()) if unclaimed_only else ()
+        for stream, path in saved or ():
+            if path in claimed:
+                continue
+            stream.close()
+            path.unlink(missing_ok=True)
+
+class ORJSONProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider backed by orjson
+    
+    Dates and datetimes are passed through to Flask's default() so they are
+    still sent as HTTP dates. Unlike the default provider, keys keep their
+    insertion order and non-ASCII text is written as UTF-8.
+    """
+    
+    option = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+    
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """Serialize obj to a JSON string"""
+        return orjson.dumps(obj, default=self.default, option=self.option).decode('utf-8')
+    
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        """Deserialize JSON from a string or bytes"""
+        return orjson.loads(s)
+
 def create_app(config_name: Optional[str] = None, test_config: Optional[Dict[str, Any]] = None) -> Flask:
     """
     Create and configure the Flask application
     
     Args:
-        config_name: Configuration environment name
+        config_name: Configuration environment name ('development', 'production'
+            or 'testing'); the shared global configuration when omitted
         test_config: Test configuration dictionary
     
     Returns:
         Configured Flask application
     """
     logger.info("Creating Flask application")
+    config = get_config_by_env(config_name) if config_name else get_config()
     
     # Create Flask app
     app = Flask(
@@ -43,6 +194,12 @@ def create_app(config_name: Optional[str] = None, test_config: Optional[Dict[str
         static_folder='../../static'
     )
     
+    # Encode JSON responses with orjson
+    app.json = ORJSONProvider(app)
+    
+    # Stream file uploads straight to the upload directory
+    app.request_class = UploadRequest
+    
     # Configure upload folder
     app.config['UPLOAD_FOLDER'] = '../../uploads'
     app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
@@ -50,26 +207,14 @@ def create_app(config_name: Optional[str] = None, test_config: Optional[Dict[str
     # Ensure upload folder exists
     os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
     
-    # Load configuration
-    if test_config is None:
-        # Load the instance config, if it exists, when not testing
-        app.config.from_object('farmer.config.settings')
-        
-        # Override with environment-specific config
-        if config_name:
-            app.config.from_object(f'farmer.config.settings.{config_name.capitalize()}Config')
-    else:
-        # Load the test config if passed in
-        app.config.update(test_config)
-    
     # Ensure the instance folder exists
     try:
         os.makedirs(app.instance_path, exist_ok=True)
     except OSError:
         pass
     
-    # Setup logging
-    setup_logging(
+    # Setup logging; the listener owns the real handlers off the request thread
+    app.extensions['log_listener'] = setup_logging(
         log_level=config.logging.level,
         log_format=config.logging.format,
         log_dir=config.logging.directory,
@@ -78,14 +223,20 @@ def create_app(config_name: Optional[str] = None, test_config: Optional[Dict[str
         json_format=config.logging.json_format
     )
     
-    # Validate configuration
+    # Validate configuration (memoized on the config instance)
     if not config.validate():
         logger.error("Configuration validation failed")
         raise RuntimeError("Invalid configuration")
     
-    # Apply Flask configuration
-    flask_config = config.get_flask_config()
-    app.config.update(flask_config)
+    # Apply the precomputed Flask configuration, then any test overrides
+    app.config.update(config.get_flask_config())
+    if test_config is not None:
+        app.config.update(test_config)
+    
+    # Resolve the upload directory once for the request handlers
+    upload_dir = Path(app.config['UPLOAD_FOLDER']).resolve()
+    upload_dir.mkdir(parents=True, exist_ok=True)
+    app.extensions['upload_dir'] = upload_dir
     
     # Initialize extensions
     init_extensions(app)
@@ -93,15 +244,16 @@ def create_app(config_name: Optional[str] = None, test_config: Optional[Dict[str
     # Register blueprints
     register_blueprints(app)
     
+    # Register request handlers first so their before_request always runs
+    register_request_handlers(app)
+    
     # Setup middleware
+    from .core.middleware import setup_middleware
     setup_middleware(app)
     
     # Register error handlers
     register_error_handlers(app)
     
-    # Register request handlers
-    register_request_handlers(app)
-    
     # Register CLI commands
     register_cli_commands(app)
     
@@ -112,9 +264,17 @@ def init_extensions(app: Flask) -> None:
     """Initialize Flask extensions"""
     logger.debug("Initializing Flask extensions")
     
+    from .core.database import init_db
+    from .core.redis_client import init_redis
+    from .models.user import start_last_login_flusher
+    
     # Initialize database
     init_db(app)
     
+    # Write users' last_login in periodic batches instead of per login
+    if app.config.get('BATCH_LAST_LOGIN') and not app.testing:
+        start_last_login_flusher(app)
+    
     # Initialize Redis
     init_redis()
     
@@ -125,33 +285,33 @@ def register_blueprints(app: Flask) -> None:
     """Register Flask blueprints"""
     logger.debug("Registering Flask blueprints")
     
+    from .api.routes import api_bp
+    
     # Register API blueprint
     app.register_blueprint(api_bp, url_prefix='/api/v1')
     
+    # Rendered index page and its ETag, filled on first request
+    index_cache = None
+    
     # Register main web routes
     @app.route('/')
     def index():
         """Serve the main application page"""
-        # Template variables
-        template_vars = {
-            'languages': {
-                'en': 'English',
-                'es': 'Español',
-                'fr': 'Français',
-                'de': 'Deutsch',
-                'hi': 'हिंदी',
-                'zh': '中文',
-                'ar': 'العربية'
-            },
-            'app_name': 'Farmer AI',
-            'app_description': 'Your AI Agriculture Assistant'
-        }
-        return render_template('index.html', **template_vars)
+        nonlocal index_cache
+        # The page is static, so render it once and serve the cached bytes
+        if index_cache is None:
+            html = render_template('index.html', **INDEX_TEMPLATE_VARS).encode('utf-8')
+            index_cache = (html, hashlib.blake2b(html, digest_size=16).hexdigest())
+        
+        html, etag = index_cache
+        response = Response(html, mimetype='text/html')
+        response.set_etag(etag)
+        return response.make_conditional(request)
     
     @app.route('/health')
     def health():
         """Simple health check endpoint"""
-        return jsonify({'status': 'healthy', 'service': 'Farmer AI Agriculture Assistant'})
+        return Response(_HEALTH_BODY, mimetype='application/json')
     
     @app.route('/chat', methods=['GET', 'POST'])
     def chat():
@@ -166,17 +326,16 @@ def register_blueprints(app: Flask) -> None:
                 })
             
             # Check if it's an image upload
-            if 'image' in request.files:
-                file = request.files['image']
-                if file.filename == '':
+            file = request.files.get('image')
+            if file is not None:
+                if not file.filename:
                     return jsonify({'error': 'No file selected'}), 400
                 
-                # Save the uploaded image
-                filename = secure_filename(file.filename)
-                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-                filename = f"{timestamp}_{filename}"
-                filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-                file.save(filepath)
+                # UploadRequest already wrote the image into the upload directory
+                path = request.upload_path(file)
+                if path is None:
+                    return jsonify({'error': 'File type not allowed'}), 400
+                filename = path.name
                 
                 # TODO: Implement actual image analysis with AI
                 response_text = f"Image '{filename}' uploaded successfully! This appears to be a healthy crop image. For detailed disease analysis, please ensure the image shows clear details of any affected areas."
@@ -188,7 +347,13 @@ def register_blueprints(app: Flask) -> None:
             
             # Handle text chat - support both JSON and form data
             if request.is_json:
-                data = request.get_json()
+                raw = request.get_data(cache=False)
+                if not raw:
+                    return jsonify({'error': 'No data provided'}), 400
+                try:
+                    data = orjson.loads(raw)
+                except orjson.JSONDecodeError:
+                    return jsonify({'error': 'Invalid JSON'}), 400
                 if not data:
                     return jsonify({'error': 'No data provided'}), 400
                 message = data.get('text', '')
@@ -207,7 +372,7 @@ def register_blueprints(app: Flask) -> None:
             })
             
         except Exception as e:
-            logger.error(f"Chat endpoint error: {e}")
+            logger.error("Chat endpoint error: %s", e)
             return jsonify({
                 'error': 'Internal server error',
                 'message': str(e)
@@ -223,18 +388,10 @@ def register_blueprints(app: Flask) -> None:
             
             # TODO: Implement actual weather API integration
             # For now, return mock data
-            mock_weather = {
-                'location': location,
-                'temperature': 25,
-                'description': 'Sunny',
-                'humidity': 65,
-                'wind_speed': 12
-            }
-            
-            return jsonify(mock_weather)
+            return _json_response(b'{', {'location': location}, _MOCK_WEATHER_SUFFIX)
             
         except Exception as e:
-            logger.error(f"Weather endpoint error: {e}")
+            logger.error("Weather endpoint error: %s", e)
             return jsonify({
                 'error': 'Unable to fetch weather data',
                 'message': str(e)
@@ -252,23 +409,14 @@ def register_blueprints(app: Flask) -> None:
             
             # TODO: Implement actual crop recommendation logic
             # For now, return mock data
-            mock_recommendations = {
-                'weather': {
-                    'temperature': 28,
-                    'humidity': 70
-                },
-                'recommendations': [
-                    'Wheat - Good for current conditions',
-                    'Corn - Suitable for your soil type',
-                    'Soybeans - Recommended for this season'
-                ],
-                'soil_info': f'Based on {soil_type or "mixed"} soil type in {location}'
-            }
-            
-            return jsonify(mock_recommendations)
+            return _json_response(
+                _MOCK_CROPS_PREFIX,
+                {'soil_info': f'Based on {soil_type or "mixed"} soil type in {location}'},
+                b'}'
+            )
             
         except Exception as e:
-            logger.error(f"Crops endpoint error: {e}")
+            logger.error("Crops endpoint error: %s", e)
             return jsonify({
                 'error': 'Unable to get crop recommendations',
                 'message': str(e)
@@ -280,17 +428,10 @@ def register_blueprints(app: Flask) -> None:
         try:
             # TODO: Implement actual market data integration
             # For now, return mock data
-            mock_prices = {
-                'wheat': {'price': '$5.50/bushel', 'trend': '↗️ +2.3%'},
-                'corn': {'price': '$4.20/bushel', 'trend': '↘️ -1.1%'},
-                'soybeans': {'price': '$12.80/bushel', 'trend': '↗️ +0.8%'},
-                'rice': {'price': '$18.50/hundredweight', 'trend': '→ 0.0%'}
-            }
-            
-            return jsonify(mock_prices)
+            return Response(_MOCK_MARKET_PRICES_JSON, mimetype='application/json')
             
         except Exception as e:
-            logger.error(f"Market endpoint error: {e}")
+            logger.error("Market endpoint error: %s", e)
             return jsonify({
                 'error': 'Unable to load market prices',
                 'message': str(e)
@@ -307,7 +448,7 @@ def register_blueprints(app: Flask) -> None:
             })
             
         except Exception as e:
-            logger.error(f"Export endpoint error: {e}")
+            logger.error("Export endpoint error: %s", e)
             return jsonify({
                 'error': 'Unable to export chat',
                 'message': str(e)
@@ -316,44 +457,48 @@ def register_blueprints(app: Flask) -> None:
     # Register other blueprints here
     # Example: app.register_blueprint(web_bp), app.register_blueprint(admin_bp), etc.
 
+def _request_timestamp() -> str:
+    """Get the timestamp cached for the current request"""
+    return g.get('ts') or datetime.utcnow().isoformat()
+
 def register_error_handlers(app: Flask) -> None:
     """Register error handlers"""
     logger.debug("Registering error handlers")
     
     @app.errorhandler(400)
     def bad_request(error):
-        logger.warning(f"Bad request: {error}")
+        logger.warning("Bad request: %s", error)
         return jsonify({
             'error': 'Bad Request',
             'message': 'The request could not be processed',
-            'timestamp': datetime.utcnow().isoformat()
+            'timestamp': _request_timestamp()
         }), 400
     
     @app.errorhandler(404)
     def not_found(error):
-        logger.warning(f"Not found: {request.url}")
+        logger.warning("Not found: %s", request.url)
         return jsonify({
             'error': 'Not Found',
             'message': 'The requested resource was not found',
-            'timestamp': datetime.utcnow().isoformat()
+            'timestamp': _request_timestamp()
         }), 404
     
     @app.errorhandler(500)
     def internal_error(error):
-        logger.error(f"Internal server error: {error}")
+        logger.error("Internal server error: %s", error)
         return jsonify({
             'error': 'Internal Server Error',
             'message': 'An unexpected error occurred',
-            'timestamp': datetime.utcnow().isoformat()
+            'timestamp': _request_timestamp()
         }), 500
     
     @app.errorhandler(Exception)
     def handle_exception(error):
-        logger.error(f"Unhandled exception: {error}", exc_info=True)
+        logger.error("Unhandled exception", exc_info=error)
         return jsonify({
             'error': 'Internal Server Error',
             'message': 'An unexpected error occurred',
-            'timestamp': datetime.utcnow().isoformat()
+            'timestamp': _request_timestamp()
         }), 500
 
 def register_request_handlers(app: Flask) -> None:
@@ -363,8 +508,13 @@ def register_request_handlers(app: Flask) -> None:
     @app.before_request
     def before_request():
         """Log request details and start timing"""
-        g.start_time = time.time()
-        g.request_id = f"req_{int(time.time() * 1000)}"
+        g.start_time = time.perf_counter()
+        g.ts = datetime.utcnow().isoformat()
+        g.request_id = f"req_{time.monotonic_ns()}_{next(_request_counter)}"
+        g.skip_log = request.path in _NOLOG_PATHS
+        
+        if g.skip_log:
+            return
         
         # Log request
         log_api_request(
@@ -380,41 +530,41 @@ def register_request_handlers(app: Flask) -> None:
     @app.after_request
     def after_request(response):
         """Log response details and timing"""
-        if hasattr(g, 'start_time'):
-            response_time = (time.time() - g.start_time) * 1000  # Convert to milliseconds
-            
-            # Log response
-            try:
-                content_length = len(response.get_data())
-            except Exception:
-                content_length = 0
-                
-            log_api_response(
-                logger,
-                method=request.method,
-                endpoint=request.endpoint or request.path,
-                status_code=response.status_code,
-                response_time=response_time,
-                request_id=getattr(g, 'request_id', None),
-                content_length=content_length
-            )
-            
-            # Add response time header
-            response.headers['X-Response-Time'] = f"{response_time:.2f}ms"
+        # Set unconditionally by before_request, which is registered first
+        start = g.start_time
+        response_time = (time.perf_counter() - start) * 1000.0  # Convert to milliseconds
+        response.headers['X-Response-Time'] = f"{response_time:.2f}ms"
+        
+        # Keep only the uploads the view claimed, and none for rejected or failed requests
+        request.discard_uploads(unclaimed_only=response.status_code < 400)
+        
+        if g.skip_log:
+            return response
+        
+        # Read the length without materializing the body; -1 for streamed responses
+        content_length = response.calculate_content_length()
+        if content_length is None:
+            content_length = int(response.headers.get('Content-Length', -1))
+        
+        # Queue response for batched logging
+        buffer_api_response(
+            access_logger,
+            method=request.method,
+            endpoint=request.endpoint or request.path,
+            status_code=response.status_code,
+            response_time=response_time,
+            request_id=g.request_id,
+            content_length=content_length
+        )
         
         return response
     
     @app.teardown_request
     def teardown_request(exception=None):
-        """Clean up request context"""
+        """Log requests that failed with an unhandled exception and drop their uploads"""
         if exception:
-            logger.error(f"Request failed: {exception}", exc_info=True)
-        
-        # Clean up request context
-        if hasattr(g, 'start_time'):
-            del g.start_time
-        if hasattr(g, 'request_id'):
-            del g.request_id
+            request.discard_uploads()
+            logger.error("Request failed: %s", exception, exc_info=True)
 
 def register_cli_commands(app: Flask) -> None:
     """Register CLI commands"""
@@ -446,7 +596,7 @@ def register_cli_commands(app: Flask) -> None:
         """Clean up old log files."""
         from .utils.file_utils import cleanup_old_files
         count = cleanup_old_files('logs', max_age_hours=24*7)  # 7 days
-        logger.info(f"Cleaned up {count} old log files")
+        logger.info("Cleaned up %s old log files", count)
     
     @app.cli.command('health-check')
     def health_check_command():
@@ -456,7 +606,7 @@ def register_cli_commands(app: Flask) -> None:
         if status['healthy']:
             logger.info("Health check passed")
         else:
-            logger.error(f"Health check failed: {status['issues']}")
+            logger.error("Health check failed: %s", status['issues'])
 
 def create_development_app() -> Flask:
     """Create development application"""
@@ -488,6 +638,7 @@ def get_app_factory(env: str = None) -> callable:
 # For direct execution
 if __name__ == '__main__':
     app = create_app()
+    config = get_config()
     app.run(
         host=config.server.host,
         port=config.server.port,
@@ -0,0 +1,5 @@
+"""
+Subcommands for the Farmer CLI, imported on demand by farmer.cli.
+"""
+
+__all__ = []
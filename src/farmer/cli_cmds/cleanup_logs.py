@@ -0,0 +1,46 @@
+"""
+CLI command: farmer cleanup-logs
+"""
+import os
+import sys
+import time
+import click
+
+from farmer.config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+@click.command('cleanup-logs')
+@click.option('--days', default=90, help='Number of days to keep logs')
+@click.option('--dry-run', is_flag=True, help='Show what would be deleted without actually deleting')
+@click.pass_context
+def cmd(ctx, days: int, dry_run: bool):
+    """Clean up old log files"""
+    
+    try:
+        log_dir = 'logs'
+        max_age_hours = days * 24
+        
+        if dry_run:
+            logger.info(f"DRY RUN: Would clean up logs older than {days} days in {log_dir}")
+            # Count files that would be deleted in a single directory pass
+            count = 0
+            cutoff = time.time() - days * 86400
+            
+            with os.scandir(log_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith('.log') and entry.is_file(follow_symlinks=False):
+                        if entry.stat().st_mtime < cutoff:
+                            count += 1
+                            logger.info(f"Would delete: {entry.path}")
+            
+            logger.info(f"DRY RUN: {count} log files would be deleted")
+        else:
+            from farmer.utils.file_utils import cleanup_old_files
+            
+            count = cleanup_old_files(log_dir, max_age_hours)
+            logger.info(f"Cleaned up {count} old log files")
+        
+    except Exception as e:
+        logger.error(f"Failed to cleanup logs: {e}")
+        sys.exit(1)
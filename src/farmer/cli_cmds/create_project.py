@@ -0,0 +1,64 @@
+"""
+CLI command: farmer create-project
+"""
+import os
+import sys
+import shutil
+import click
+from pathlib import Path
+from typing import Optional
+
+from farmer.config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+def _fast_copytree(src: str, dst: str) -> None:
+    """Copy a template tree, skipping the permission/timestamp copying of shutil.copytree"""
+    os.makedirs(dst, exist_ok=True)
+    with os.scandir(src) as entries:
+        for entry in entries:
+            target = os.path.join(dst, entry.name)
+            if entry.is_dir(follow_symlinks=False):
+                _fast_copytree(entry.path, target)
+            else:
+                shutil.copyfile(entry.path, target)
+
+@click.command('create-project')
+@click.option('--template', '-t', help='Template to use for new project')
+@click.option('--output', '-o', default='./farmer-project', help='Output directory')
+@click.pass_context
+def cmd(ctx, template: Optional[str], output: str):
+    """Create a new Farmer project"""
+    
+    try:
+        logger.info(f"Creating new Farmer project in {output}")
+        
+        # Create project structure
+        project_path = Path(output)
+        project_path.mkdir(parents=True, exist_ok=True)
+        
+        # Copy template files
+        template_dir = Path(__file__).parents[2] / 'templates' / (template or 'default')
+        
+        if template_dir.exists():
+            _fast_copytree(template_dir, project_path)
+            logger.info(f"Project created from template: {template}")
+        else:
+            # Create basic structure
+            (project_path / 'src').mkdir(exist_ok=True)
+            (project_path / 'tests').mkdir(exist_ok=True)
+            (project_path / 'logs').mkdir(exist_ok=True)
+            (project_path / 'docs').mkdir(exist_ok=True)
+            
+            # Create basic files
+            (project_path / 'README.md').write_text('# Farmer AI Agriculture Assistant\n\nYour project description here.')
+            (project_path / '.env.example').write_text('# Environment variables\nOPENAI_API_KEY=your_key_here\nHUGGINGFACE_KEY=your_key_here')
+            
+            logger.info("Basic project structure created")
+        
+        logger.info(f"Project created successfully in {output}")
+        click.echo(f"Project created in {output}")
+        
+    except Exception as e:
+        logger.error(f"Failed to create project: {e}")
+        sys.exit(1)
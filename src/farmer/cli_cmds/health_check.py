@@ -0,0 +1,40 @@
+"""
+CLI command: farmer health-check
+"""
+import sys
+import click
+
+from farmer.config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+@click.command('health-check')
+@click.pass_context
+def cmd(ctx):
+    """Perform system health check"""
+    
+    try:
+        from farmer import create_app
+        
+        config_env = ctx.obj['config_env']
+        logger.info(f"Performing health check in {config_env} mode")
+        
+        app = create_app(config_env)
+        
+        with app.app_context():
+            from farmer.core.health import perform_health_check
+            
+            status = perform_health_check()
+            
+            if status['status'] == 'healthy':
+                logger.info("✅ Health check passed")
+                click.echo("System is healthy")
+                click.echo(f"Status: {status['status']}")
+            else:
+                logger.error(f"❌ Health check failed: {status.get('error', 'Unknown error')}")
+                click.echo(f"System has issues: {status.get('error', 'Unknown error')}")
+                sys.exit(1)
+        
+    except Exception as e:
+        logger.error(f"Failed to perform health check: {e}")
+        sys.exit(1)
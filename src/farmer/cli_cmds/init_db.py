@@ -0,0 +1,43 @@
+"""
+CLI command: farmer init-db
+"""
+import sys
+import click
+
+from farmer.config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+@click.command('init-db')
+@click.option('--force', is_flag=True, help='Force recreation of database')
+@click.pass_context
+def cmd(ctx, force: bool):
+    """Initialize the database"""
+    
+    try:
+        from farmer import create_app
+        
+        config_env = ctx.obj['config_env']
+        logger.info(f"Initializing database in {config_env} mode")
+        
+        app = create_app(config_env)
+        
+        with app.app_context():
+            from farmer.core.database import init_db, create_tables
+            
+            # Initialize database
+            init_db(app)
+            logger.info("Database connection initialized")
+            
+            # Create tables
+            create_tables()
+            logger.info("Database tables created")
+            
+            if force:
+                logger.info("Database recreated successfully")
+            else:
+                logger.info("Database initialized successfully")
+        
+    except Exception as e:
+        logger.error(f"Failed to initialize database: {e}")
+        sys.exit(1)
@@ -0,0 +1,50 @@
+"""
+CLI command: farmer run
+"""
+import sys
+import click
+
+from farmer.config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+@click.command('run')
+@click.option('--host', default='0.0.0.0', help='Host to bind to')
+@click.option('--port', default=5000, help='Port to bind to')
+@click.option('--debug', is_flag=True, help='Enable debug mode')
+@click.option('--reload', is_flag=True, help='Enable auto-reload')
+@click.pass_context
+def cmd(ctx, host: str, port: int, debug: bool, reload: bool):
+    """Run the Farmer AI Agriculture Assistant web server"""
+    
+    try:
+        from farmer import create_app
+        
+        config_env = ctx.obj['config_env']
+        logger.info(f"Starting Farmer server in {config_env} mode")
+        
+        # Create application
+        app = create_app(config_env)
+        
+        # Override configuration if specified
+        if host != '0.0.0.0':
+            app.config['HOST'] = host
+        if port != 5000:
+            app.config['PORT'] = port
+        if debug:
+            app.config['DEBUG'] = True
+        
+        logger.info(f"Server will start on {host}:{port}")
+        logger.info(f"Debug mode: {'enabled' if debug else 'disabled'}")
+        
+        # Run the application
+        app.run(
+            host=host,
+            port=port,
+            debug=debug,
+            use_reloader=reload
+        )
+        
+    except Exception as e:
+        logger.error(f"Failed to start server: {e}")
+        sys.exit(1)
@@ -0,0 +1,38 @@
+"""
+CLI command: farmer show-config
+"""
+import sys
+import click
+from typing import Optional
+
+from farmer.config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+@click.command('show-config')
+@click.option('--output', '-o', help='Output file for configuration')
+@click.pass_context
+def cmd(ctx, output: Optional[str]):
+    """Show current configuration"""
+    
+    try:
+        from farmer.config.settings import get_config_by_env
+        
+        config_env = ctx.obj['config_env']
+        logger.info(f"Showing configuration for {config_env} mode")
+        
+        config = get_config_by_env(config_env)
+        config_dict = config.to_dict()
+        
+        if output:
+            import json
+            with open(output, 'w') as f:
+                json.dump(config_dict, f, indent=2, default=str)
+            logger.info(f"Configuration saved to {output}")
+        else:
+            import json
+            click.echo(json.dumps(config_dict, indent=2, default=str))
+        
+    except Exception as e:
+        logger.error(f"Failed to show configuration: {e}")
+        sys.exit(1)
@@ -0,0 +1,38 @@
+"""
+CLI command: farmer test
+"""
+import os
+import sys
+import click
+from pathlib import Path
+
+from farmer.config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+@click.command('test')
+@click.pass_context
+def cmd(ctx):
+    """Run the test suite"""
+    
+    try:
+        logger.info("Running test suite")
+        
+        # Change to project root
+        project_root = Path(__file__).parents[3]
+        os.chdir(project_root)
+        
+        # Run tests in-process; pytest writes its report straight to the terminal
+        import pytest
+        returncode = pytest.main(['tests/', '-v'])
+        
+        if returncode == 0:
+            logger.info("✅ All tests passed")
+            click.echo("All tests passed")
+        else:
+            logger.error("❌ Some tests failed")
+            sys.exit(1)
+        
+    except Exception as e:
+        logger.error(f"Failed to run tests: {e}")
+        sys.exit(1)
@@ -2,11 +2,18 @@
 Configuration package for Farmer AI Agriculture Assistant.
 """
 
-from .settings import get_config, config, Config
+from .settings import get_config, reload_config, Config
 from .logging_config import setup_logging, get_logger
 
+def __getattr__(name):
+    """Resolve the global `config` instance lazily"""
+    if name == 'config':
+        return get_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 __all__ = [
     'get_config',
+    'reload_config',
     'config', 
     'Config',
     'setup_logging',
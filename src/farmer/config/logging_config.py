@@ -2,13 +2,23 @@
 Logging configuration for the Farmer AI Agriculture Assistant
 """
 import os
+import atexit
+import queue
+import threading
+import time
 import logging
 import logging.handlers
+from collections import deque
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Callable, List, Optional
 import json
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
 # Log levels
 LOG_LEVELS = {
     'DEBUG': logging.DEBUG,
@@ -18,6 +28,12 @@ LOG_LEVELS = {
     'CRITICAL': logging.CRITICAL
 }
 
+# Most verbose level that hot-path log calls guarded by it may emit, e.g.
+#   if __debug__ and MAX_LOG_LEVEL <= logging.DEBUG: logger.debug(...)
+# Set FARMER_MAX_LOG_LEVEL=INFO to skip debug blocks; under `python -O`
+# __debug__ is False and CPython drops such blocks at compile time.
+MAX_LOG_LEVEL = LOG_LEVELS.get(os.getenv('FARMER_MAX_LOG_LEVEL', 'DEBUG').upper(), logging.DEBUG)
+
 # Log formats
 LOG_FORMATS = {
     'detailed': '%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(funcName)s - %(message)s',
@@ -25,6 +41,30 @@ LOG_FORMATS = {
     'json': '%(asctime)s - %(name)s - %(levelname)s - %(message)s - %(extra)s'
 }
 
+# Set once setup_logging has installed the real handlers
+_configured = False
+
+# Background listeners that own the real (blocking) handlers
+_listeners: List[logging.handlers.QueueListener] = []
+
+# Arguments of the last setup_logging call and the root listener it started
+_last_config: Optional[tuple] = None
+_root_listener: Optional[logging.handlers.QueueListener] = None
+
+# Batched API response logging
+ACCESS_LOG_BATCH_SIZE = 100
+ACCESS_LOG_FLUSH_INTERVAL_MS = 1000
+
+_access_buffer: deque = deque()
+_access_lock = threading.Lock()
+_access_flusher: Optional[threading.Thread] = None
+
+def _json_dumps(obj: Any) -> str:
+    """Serialize a log entry, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    return json.dumps(obj, default=str)
+
 class JSONFormatter(logging.Formatter):
     """Custom JSON formatter for structured logging"""
     
@@ -47,7 +87,7 @@ class JSONFormatter(logging.Formatter):
         if record.exc_info:
             log_entry['exception'] = self.formatException(record.exc_info)
         
-        return json.dumps(log_entry, default=str)
+        return _json_dumps(log_entry)
 
 class ColoredFormatter(logging.Formatter):
     """Custom colored formatter for console output"""
@@ -61,13 +101,50 @@ class ColoredFormatter(logging.Formatter):
         'RESET': '\033[0m'        # Reset
     }
     
+    # Colored level names, built once
+    COLORED = {
+        level: f"{code}{level}\033[0m"
+        for level, code in COLORS.items() if level != 'RESET'
+    }
+    
     def format(self, record: logging.LogRecord) -> str:
-        # Add color to level name
+        # Add color to level name, restoring it so other handlers see plain text
         levelname = record.levelname
-        if levelname in self.COLORS:
-            record.levelname = f"{self.COLORS[levelname]}{levelname}{self.COLORS['RESET']}"
-        
-        return super().format(record)
+        record.levelname = self.COLORED.get(levelname, levelname)
+        try:
+            return super().format(record)
+        finally:
+            record.levelname = levelname
+
+class SampledRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """RotatingFileHandler that only checks the file size every ROLLOVER_CHECK_INTERVAL records"""
+    
+    ROLLOVER_CHECK_INTERVAL = 64  # must be a power of two
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._record_count = 0
+    
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        self._record_count = (self._record_count + 1) & (self.ROLLOVER_CHECK_INTERVAL - 1)
+        return self._record_count == 0 and super().shouldRollover(record)
+
+class AccessFilter(logging.Filter):
+    """Keep access log records off a handler; they are written to the app log file"""
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.name != 'farmer.access'
+
+class LazyStr:
+    """Defer building a log argument until a handler formats the record"""
+    
+    __slots__ = ('func',)
+    
+    def __init__(self, func: Callable[[], Any]):
+        self.func = func
+    
+    def __str__(self) -> str:
+        return str(self.func())
 
 def setup_logging(
     log_level: str = 'INFO',
@@ -78,10 +155,14 @@ def setup_logging(
     max_file_size: int = 10 * 1024 * 1024,  # 10MB
     backup_count: int = 5,
     json_format: bool = False
-) -> None:
+) -> Optional[logging.handlers.QueueListener]:
     """
     Set up logging configuration for the application
     
+    Console and file handlers are owned by a background QueueListener;
+    loggers only get a QueueHandler, so emitting a record never blocks
+    the calling thread on I/O.
+    
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_format: Log format style (detailed, simple, json)
@@ -91,51 +172,73 @@ def setup_logging(
         max_file_size: Maximum size of log files before rotation
         backup_count: Number of backup files to keep
         json_format: Use JSON format for structured logging
+    
+    Returns:
+        The listener feeding the root logger's handlers, if any
     """
     
-    # Create logs directory if it doesn't exist
+    global _configured, _last_config, _root_listener
+    
+    # Nothing to do if the same configuration is already in place
+    config_key = (log_level, log_format, log_dir, console_output, file_output, max_file_size, backup_count, json_format)
+    if config_key == _last_config:
+        return _root_listener
+    
+    # Resolve the level and format once
+    level = LOG_LEVELS.get(log_level.upper(), logging.INFO)
+    fmt_str = LOG_FORMATS[log_format]
+    
+    # Create logs directory only when file output needs it
     log_path = Path(log_dir)
-    log_path.mkdir(exist_ok=True)
+    if file_output:
+        log_path.mkdir(exist_ok=True)
     
     # Get the root logger
     root_logger = logging.getLogger()
-    root_logger.setLevel(LOG_LEVELS.get(log_level.upper(), logging.INFO))
+    root_logger.setLevel(level)
     
-    # Clear existing handlers
+    # Clear existing handlers and stop the listeners that served them
+    stop_logging_listeners()
     root_logger.handlers.clear()
+    access_logger = logging.getLogger('farmer.access')
+    access_logger.handlers.clear()
+    handlers = []
     
-    # Create formatters
+    # Create formatters; file handlers share one instance
     if json_format:
-        formatter = JSONFormatter()
-        file_formatter = JSONFormatter()
+        formatter = file_formatter = JSONFormatter()
     else:
-        formatter = ColoredFormatter(LOG_FORMATS[log_format])
-        file_formatter = logging.Formatter(LOG_FORMATS[log_format])
+        formatter = ColoredFormatter(fmt_str)
+        file_formatter = logging.Formatter(fmt_str)
     
     # Console handler
     if console_output:
         console_handler = logging.StreamHandler()
-        console_handler.setLevel(LOG_LEVELS.get(log_level.upper(), logging.INFO))
+        console_handler.setLevel(level)
         console_handler.setFormatter(formatter)
-        root_logger.addHandler(console_handler)
+        if file_output:
+            console_handler.addFilter(AccessFilter())
+        handlers.append(console_handler)
     
     # File handlers
     if file_output:
+        today = datetime.now().strftime('%Y%m%d')
+        
         # Main application log
-        app_log_file = log_path / f"farmer_{datetime.now().strftime('%Y%m%d')}.log"
-        app_handler = logging.handlers.RotatingFileHandler(
+        app_log_file = log_path / f"farmer_{today}.log"
+        app_handler = SampledRotatingFileHandler(
             app_log_file,
             maxBytes=max_file_size,
             backupCount=backup_count,
             encoding='utf-8'
         )
-        app_handler.setLevel(LOG_LEVELS.get(log_level.upper(), logging.INFO))
+        app_handler.setLevel(level)
         app_handler.setFormatter(file_formatter)
-        root_logger.addHandler(app_handler)
+        handlers.append(app_handler)
         
         # Error log (only errors and critical)
-        error_log_file = log_path / f"farmer_errors_{datetime.now().strftime('%Y%m%d')}.log"
-        error_handler = logging.handlers.RotatingFileHandler(
+        error_log_file = log_path / f"farmer_errors_{today}.log"
+        error_handler = SampledRotatingFileHandler(
             error_log_file,
             maxBytes=max_file_size,
             backupCount=backup_count,
@@ -143,29 +246,21 @@ def setup_logging(
         )
         error_handler.setLevel(logging.ERROR)
         error_handler.setFormatter(file_formatter)
-        root_logger.addHandler(error_handler)
-        
-        # Access log for web requests
-        access_log_file = log_path / f"farmer_access_{datetime.now().strftime('%Y%m%d')}.log"
-        access_handler = logging.handlers.RotatingFileHandler(
-            access_log_file,
-            maxBytes=max_file_size,
-            backupCount=backup_count,
-            encoding='utf-8'
-        )
-        access_handler.setLevel(logging.INFO)
-        access_handler.setFormatter(file_formatter)
-        
-        # Create access logger
-        access_logger = logging.getLogger('farmer.access')
-        access_logger.addHandler(access_handler)
+        handlers.append(error_handler)
+    
+    listener = _attach_queue(root_logger, handlers)
+    
+    # Access records share the root queue and land in the app log file only;
+    # the console handler filters them out and they never reach ERROR level
+    if file_output:
+        access_logger.addHandler(logging.handlers.QueueHandler(listener.queue))
         access_logger.propagate = False
     
     # Set specific logger levels
-    logging.getLogger('farmer').setLevel(LOG_LEVELS.get(log_level.upper(), logging.INFO))
-    logging.getLogger('farmer.api').setLevel(LOG_LEVELS.get(log_level.upper(), logging.INFO))
-    logging.getLogger('farmer.core').setLevel(LOG_LEVELS.get(log_level.upper(), logging.INFO))
-    logging.getLogger('farmer.services').setLevel(LOG_LEVELS.get(log_level.upper(), logging.INFO))
+    logging.getLogger('farmer').setLevel(level)
+    logging.getLogger('farmer.api').setLevel(level)
+    logging.getLogger('farmer.core').setLevel(level)
+    logging.getLogger('farmer.services').setLevel(level)
     
     # Reduce noise from external libraries
     logging.getLogger('urllib3').setLevel(logging.WARNING)
@@ -173,6 +268,38 @@ def setup_logging(
     logging.getLogger('openai').setLevel(logging.WARNING)
     logging.getLogger('PIL').setLevel(logging.WARNING)
     logging.getLogger('cv2').setLevel(logging.WARNING)
+    
+    _configured = True
+    _last_config = config_key
+    _root_listener = listener
+    return listener
+
+def _attach_queue(logger: logging.Logger, handlers: List[logging.Handler]) -> Optional[logging.handlers.QueueListener]:
+    """Attach a QueueHandler to logger and start a listener driving handlers"""
+    if not handlers:
+        return None
+    
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    _listeners.append(listener)
+    return listener
+
+def stop_logging_listeners() -> None:
+    """Flush pending records and stop all background logging listeners"""
+    global _last_config, _root_listener
+    
+    _last_config = None
+    _root_listener = None
+    while _listeners:
+        listener = _listeners.pop()
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
+atexit.register(stop_logging_listeners)
 
 def get_logger(name: str) -> logging.Logger:
     """
@@ -195,7 +322,9 @@ def log_function_call(logger: logging.Logger, func_name: str, **kwargs):
         func_name: Name of the function being called
         **kwargs: Function parameters to log
     """
-    logger.debug(f"Calling {func_name} with parameters: {kwargs}")
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+    logger.debug("Calling %s with parameters: %s", func_name, kwargs)
 
 def log_function_result(logger: logging.Logger, func_name: str, result: Any):
     """
@@ -206,7 +335,9 @@ def log_function_result(logger: logging.Logger, func_name: str, result: Any):
         func_name: Name of the function
         result: Function result to log
     """
-    logger.debug(f"{func_name} returned: {result}")
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+    logger.debug("%s returned: %s", func_name, result)
 
 def log_error_with_context(logger: logging.Logger, error: Exception, context: str = "", **kwargs):
     """
@@ -227,37 +358,105 @@ def log_error_with_context(logger: logging.Logger, error: Exception, context: st
 # Convenience functions for common logging patterns
 def log_api_request(logger: logging.Logger, method: str, endpoint: str, user_id: str = None, **kwargs):
     """Log API request details"""
+    if not logger.isEnabledFor(logging.INFO):
+        return
     extra = f"User: {user_id}" if user_id else ""
     if kwargs:
         extra += f" | {kwargs}"
-    logger.info(f"API Request: {method} {endpoint} | {extra}")
+    logger.info("API Request: %s %s | %s", method, endpoint, extra)
 
-def log_api_response(logger: logging.Logger, method: str, endpoint: str, status_code: int, response_time: float, **kwargs):
-    """Log API response details"""
+def _format_api_response(method: str, endpoint: str, status_code: int, response_time: float, kwargs: Dict[str, Any]) -> str:
+    """Format a single API response log line"""
     extra = f"Response time: {response_time:.3f}s"
     if kwargs:
         extra += f" | {kwargs}"
-    logger.info(f"API Response: {method} {endpoint} | Status: {status_code} | {extra}")
+    return f"API Response: {method} {endpoint} | Status: {status_code} | {extra}"
+
+def buffer_api_response(logger: logging.Logger, method: str, endpoint: str, status_code: int, response_time: float, **kwargs):
+    """
+    Queue API response details for batched logging
+    
+    Entries are written as one multi-line record per logger every
+    ACCESS_LOG_FLUSH_INTERVAL_MS, or as soon as ACCESS_LOG_BATCH_SIZE
+    entries are pending.
+    """
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    with _access_lock:
+        _access_buffer.append((logger, (method, endpoint, status_code, response_time, kwargs)))
+        full = len(_access_buffer) >= ACCESS_LOG_BATCH_SIZE
+    
+    if _access_flusher is None:
+        _start_access_flusher()
+    if full:
+        flush_api_responses()
+
+def flush_api_responses() -> None:
+    """Write out all buffered API response entries"""
+    while True:
+        with _access_lock:
+            if not _access_buffer:
+                return
+            count = min(len(_access_buffer), ACCESS_LOG_BATCH_SIZE)
+            batch = [_access_buffer.popleft() for _ in range(count)]
+        
+        lines: Dict[logging.Logger, List[str]] = {}
+        for logger, entry in batch:
+            lines.setdefault(logger, []).append(_format_api_response(*entry))
+        for logger, logger_lines in lines.items():
+            logger.info("\n".join(logger_lines))
+
+def _start_access_flusher() -> None:
+    """Start the background thread that periodically flushes API responses"""
+    global _access_flusher
+    
+    with _access_lock:
+        if _access_flusher is not None:
+            return
+        _access_flusher = threading.Thread(target=_run_access_flusher, name='farmer-access-log', daemon=True)
+    _access_flusher.start()
+
+def _run_access_flusher() -> None:
+    """Flush loop for buffered API responses"""
+    interval = ACCESS_LOG_FLUSH_INTERVAL_MS / 1000
+    while True:
+        time.sleep(interval)
+        flush_api_responses()
+
+# Registered after the listener shutdown hook so it runs first at exit
+atexit.register(flush_api_responses)
 
 def log_database_operation(logger: logging.Logger, operation: str, table: str, record_id: str = None, **kwargs):
     """Log database operations"""
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
     extra = f"Record ID: {record_id}" if record_id else ""
     if kwargs:
         extra += f" | {kwargs}"
-    logger.debug(f"Database {operation}: {table} | {extra}")
+    logger.debug("Database %s: %s | %s", operation, table, extra)
 
 def log_file_operation(logger: logging.Logger, operation: str, file_path: str, file_size: int = None, **kwargs):
     """Log file operations"""
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
     extra = f"Size: {file_size} bytes" if file_size else ""
     if kwargs:
         extra += f" | {kwargs}"
-    logger.debug(f"File {operation}: {file_path} | {extra}")
+    logger.debug("File %s: %s | %s", operation, file_path, extra)
+
+class _LazyHandler(logging.Handler):
+    """Placeholder root handler that configures logging on the first record"""
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        # init_logging replaces this handler, so pass the record to the real ones
+        init_logging()
+        logging.getLogger().callHandlers(record)
 
 # Initialize logging with default configuration
 def init_logging():
     """Initialize logging with default configuration"""
     # Check if logging is already configured
-    if logging.getLogger().handlers:
+    if _configured:
         return
     
     # Get configuration from environment variables
@@ -277,5 +476,14 @@ def init_logging():
         json_format=json_format
     )
 
-# Auto-initialize logging when module is imported
-init_logging()
+def install_lazy_logging():
+    """Defer handler setup until the first record is emitted"""
+    root_logger = logging.getLogger()
+    if _configured or root_logger.handlers:
+        return
+    
+    root_logger.setLevel(LOG_LEVELS.get(os.getenv('FARMER_LOG_LEVEL', 'INFO').upper(), logging.INFO))
+    root_logger.addHandler(_LazyHandler())
+
+# Install the lazy handler when module is imported; no files are opened yet
+install_lazy_logging()
@@ -4,12 +4,56 @@ Health check functionality
 import logging
 import os
 import sys
-from typing import Dict, Any
+import time
+from typing import Dict, Any, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Seconds a health check result is reused before the checks run again
+HEALTH_CACHE_TTL = 5
+
+# (monotonic time, result) of the last health check
+_health_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+
+# Environment variables and directories covered by the health check
+_REQUIRED_ENV = ('OPENAI_API_KEY', 'HUGGINGFACE_KEY')
+_HEALTH_DIRS = ('logs', 'uploads', 'static')
+
+# Python version and environment checks can't change while the process runs
+_PYTHON_CHECK = {
+    'status': 'healthy',
+    'version': f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"
+}
+_env_checks: Optional[Dict[str, Dict[str, str]]] = None
+
+def _check_environment() -> Dict[str, Dict[str, str]]:
+    """Check required environment variables once per process"""
+    global _env_checks
+    
+    if _env_checks is None:
+        env_status = {}
+        for var in _REQUIRED_ENV:
+            if os.getenv(var):
+                env_status[var] = {'status': 'healthy', 'value': '***'}
+            else:
+                env_status[var] = {'status': 'warning', 'value': 'Not set'}
+        _env_checks = env_status
+    # Callers get their own copy so the cached checks can't be mutated
+    return {var: dict(check) for var, check in _env_checks.items()}
+
 def check_system_health() -> Dict[str, Any]:
-    """Perform comprehensive system health check"""
+    """
+    Perform comprehensive system health check
+    
+    The result is cached for HEALTH_CACHE_TTL seconds so frequent probes
+    don't repeat the filesystem checks; treat it as read-only.
+    """
+    global _health_cache
+    
+    now = time.monotonic()
+    if _health_cache is not None and now - _health_cache[0] < HEALTH_CACHE_TTL:
+        return _health_cache[1]
+    
     health_status = {
         'status': 'healthy',
         'checks': {},
@@ -18,45 +62,30 @@ def check_system_health() -> Dict[str, Any]:
     
     try:
         # Check Python version
-        python_version = sys.version_info
-        health_status['checks']['python'] = {
-            'status': 'healthy',
-            'version': f"{python_version.major}.{python_version.minor}.{python_version.micro}"
-        }
+        health_status['checks']['python'] = dict(_PYTHON_CHECK)
         
         # Check environment variables
-        required_env_vars = ['OPENAI_API_KEY', 'HUGGINGFACE_KEY']
-        env_status = {}
-        for var in required_env_vars:
-            if os.getenv(var):
-                env_status[var] = {'status': 'healthy', 'value': '***'}
-            else:
-                env_status[var] = {'status': 'warning', 'value': 'Not set'}
-        
-        health_status['checks']['environment'] = env_status
+        health_status['checks']['environment'] = _check_environment()
         
-        # Check file permissions
+        # Check file permissions; access() honours the process's uid, groups and root,
+        # and the common writable case costs a single syscall
         file_checks = {}
-        directories = ['logs', 'uploads', 'static']
-        for directory in directories:
-            if os.path.exists(directory):
-                if os.access(directory, os.W_OK):
-                    file_checks[directory] = {'status': 'healthy', 'writable': True}
-                else:
-                    file_checks[directory] = {'status': 'unhealthy', 'writable': False}
+        for directory in _HEALTH_DIRS:
+            if os.access(directory, os.W_OK):
+                file_checks[directory] = {'status': 'healthy', 'writable': True}
+            elif os.path.exists(directory):
+                file_checks[directory] = {'status': 'unhealthy', 'writable': False}
             else:
                 file_checks[directory] = {'status': 'warning', 'exists': False}
         
         health_status['checks']['filesystem'] = file_checks
         
         # Overall status
-        all_healthy = True
-        for category, checks in health_status['checks'].items():
-            if isinstance(checks, dict):
-                for check_name, check_data in checks.items():
-                    if isinstance(check_data, dict) and check_data.get('status') == 'unhealthy':
-                        all_healthy = False
-                        break
+        all_healthy = not any(
+            check_data.get('status') == 'unhealthy'
+            for checks in health_status['checks'].values() if isinstance(checks, dict)
+            for check_data in checks.values() if isinstance(check_data, dict)
+        )
         
         health_status['status'] = 'healthy' if all_healthy else 'unhealthy'
         
@@ -67,6 +96,7 @@ def check_system_health() -> Dict[str, Any]:
         health_status['status'] = 'error'
         health_status['error'] = str(e)
     
+    _health_cache = (now, health_status)
     return health_status
 
 # Alias for CLI compatibility
@@ -1,46 +1,58 @@
 """
 Middleware for request/response handling
 """
-from flask import request, g, current_app
+from flask import request, g
 import time
 import logging
 
+from ..config.logging_config import LazyStr
+
 logger = logging.getLogger(__name__)
 
 def setup_middleware(app):
     """Setup middleware for the Flask app"""
     
+    # Read once; the app config is final by the time middleware is installed
+    log_headers = app.config.get('FARMER_DEBUG', False)
+    
     @app.before_request
     def before_request():
         """Log request details and start timing"""
-        g.start_time = time.time()
+        g.start_time = time.perf_counter()
+        
+        # Health probes are flagged by the app's request handlers
+        if g.get('skip_log', False):
+            return
         
         # Log request
-        logger.info(f"Request: {request.method} {request.path} from {request.remote_addr}")
+        logger.info("Request: %s %s from %s", request.method, request.path, request.remote_addr)
         
         # Log request headers for debugging
-        if current_app.config.get('FARMER_DEBUG', False):
-            logger.debug(f"Request headers: {dict(request.headers)}")
+        if log_headers and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Request headers: %s", LazyStr(lambda: dict(request.headers)))
     
     @app.after_request
     def after_request(response):
         """Log response details and timing"""
+        if g.get('skip_log', False):
+            return response
+        
         if hasattr(g, 'start_time'):
-            duration = (time.time() - g.start_time) * 1000  # Convert to milliseconds
-            logger.info(f"Response: {response.status_code} in {duration:.2f}ms")
+            duration = (time.perf_counter() - g.start_time) * 1000  # Convert to milliseconds
+            logger.info("Response: %s in %.2fms", response.status_code, duration)
         else:
-            logger.info(f"Response: {response.status_code}")
+            logger.info("Response: %s", response.status_code)
         
         return response
     
     @app.errorhandler(404)
     def not_found(error):
         """Handle 404 errors"""
-        logger.warning(f"404 error: {request.path}")
+        logger.warning("404 error: %s", request.path)
         return {'error': 'Not found'}, 404
     
     @app.errorhandler(500)
     def internal_error(error):
         """Handle 500 errors"""
-        logger.error(f"500 error: {error}")
+        logger.error("500 error: %s", error)
         return {'error': 'Internal server error'}, 500
@@ -3,55 +3,107 @@ Redis client initialization and management
 """
 import redis
 import logging
-from typing import Optional
+import threading
+from typing import Any, List, Union
 from ..config.settings import get_config
 
 # Get logger
 logger = logging.getLogger(__name__)
 
-# Global Redis client
-redis_client: Optional[redis.Redis] = None
+class NullRedisClient:
+    """Stand-in used when Redis is unavailable; every command is a no-op returning None"""
+    
+    def __bool__(self) -> bool:
+        return False
+    
+    def __getattr__(self, name: str):
+        return _noop
+    
+    def pipeline(self, transaction: bool = True) -> 'NullRedisClient':
+        """Queued commands are dropped, so the client doubles as its own pipeline"""
+        return self
+    
+    def execute(self) -> List[Any]:
+        """Execute an (empty) pipeline"""
+        return []
+
+def _noop(*args, **kwargs) -> None:
+    return None
+
+# Global Redis client; falsy NullRedisClient when Redis is unavailable
+redis_client: Union[redis.Redis, NullRedisClient] = NullRedisClient()
+
+_initialized = False
+_init_lock = threading.Lock()
 
 def init_redis():
     """Initialize Redis client"""
-    global redis_client
+    global redis_client, _initialized
     
     try:
         config = get_config()
         
-        redis_client = redis.Redis(
+        # Pooled connections let concurrent requests talk to Redis in parallel
+        pool = redis.ConnectionPool(
             host=config.redis.host,
             port=config.redis.port,
             db=config.redis.db,
             password=config.redis.password,
             decode_responses=config.redis.decode_responses,
-            socket_connect_timeout=5,
-            socket_timeout=5,
-            retry_on_timeout=True
+            max_connections=config.redis.max_connections,
+            socket_connect_timeout=config.redis.socket_connect_timeout,
+            socket_timeout=config.redis.socket_timeout,
+            retry_on_timeout=True,
+            health_check_interval=30
         )
+        client = redis.Redis(connection_pool=pool)
         
         # Test connection
-        redis_client.ping()
+        client.ping()
+        redis_client = client
         logger.info("Redis client initialized successfully")
         
     except Exception as e:
-        logger.warning(f"Redis not available: {e}. Running without Redis cache.")
-        redis_client = None
-
-def get_redis() -> Optional[redis.Redis]:
-    """Get Redis client instance"""
-    global redis_client
+        logger.warning("Redis not available: %s. Running without Redis cache.", e)
+        redis_client = NullRedisClient()
     
-    if redis_client is None:
-        init_redis()
+    _initialized = True
+
+def _init_once():
+    """Run init_redis exactly once, even with concurrent first callers"""
+    with _init_lock:
+        if not _initialized:
+            init_redis()
+
+def get_redis() -> Union[redis.Redis, NullRedisClient]:
+    """
+    Get Redis client instance
     
+    Initialization (including the ping) happens only on the first call;
+    when Redis is unavailable a falsy NullRedisClient is returned.
+    """
+    if not _initialized:
+        _init_once()
     return redis_client
 
+def get_pipeline() -> Union[redis.client.Pipeline, NullRedisClient]:
+    """
+    Get a non-transactional pipeline for batching several commands
+    
+    Commands queued on the pipeline are sent in one round trip when
+    execute() is called.
+    
+    Returns:
+        Pipeline on the shared client, or a no-op NullRedisClient if Redis is unavailable
+    """
+    return get_redis().pipeline(transaction=False)
+
 def close_redis():
     """Close Redis connection"""
-    global redis_client
+    global redis_client, _initialized
     
     if redis_client:
         redis_client.close()
-        redis_client = None
         logger.info("Redis connection closed")
+    redis_client = NullRedisClient()
+    _initialized = False
@@ -2,7 +2,8 @@
 Database models for the Farmer AI Agriculture Assistant
 """
 
-from .chat import ChatHistory, Base
+from .base import Base
+from .chat import ChatHistory
 from .user import User
 from .session import UserSession
 
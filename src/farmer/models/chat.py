@@ -2,17 +2,19 @@
 Chat history model for storing user interactions
 """
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Text, DateTime, Index, ForeignKey
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship
-from typing import Optional, Dict, Any
-import json
+from sqlalchemy import Column, Integer, String, Text, DateTime, Index, ForeignKey, event, inspect, text
+from sqlalchemy.orm import relationship, validates
+from sqlalchemy.orm.attributes import flag_modified
+from typing import Any, Dict, List, Optional
+import orjson
 
+from .base import Base
 from ..config.logging_config import get_logger
 
 logger = get_logger(__name__)
 
-Base = declarative_base()
+# orjson.Fragment (orjson >= 3.9) embeds already-serialized JSON without re-parsing it
+_JSONFragment = getattr(orjson, 'Fragment', None)
 
 class ChatHistory(Base):
     """Chat history model for storing user interactions"""
@@ -20,12 +22,12 @@ class ChatHistory(Base):
     __tablename__ = 'chat_history'
     
     id = Column(Integer, primary_key=True, autoincrement=True)
-    user_id = Column(String(50), nullable=False, index=True)
-    session_id = Column(String(100), nullable=True, index=True)
+    user_id = Column(String(50), ForeignKey('users.user_id'), nullable=False)
+    session_id = Column(String(100), nullable=True)
     message = Column(Text, nullable=False)
     response = Column(Text, nullable=False)
     message_type = Column(String(20), default='text')  # text, voice, image
-    timestamp = Column(DateTime, default=datetime.utcnow, index=True)
+    timestamp = Column(DateTime, default=datetime.utcnow)
     meta_data = Column(Text, nullable=True)  # JSON string for additional data
     response_time = Column(Integer, nullable=True)  # Response time in milliseconds
     error_occurred = Column(String(1), default='N')  # Y/N flag for errors
@@ -33,42 +35,49 @@ class ChatHistory(Base):
     # Relationships
     user = relationship("User", back_populates="chat_history", foreign_keys=[user_id])
     
-    # Indexes for better query performance
+    # Indexes for better query performance; the composites also serve
+    # lookups on their leading user_id/session_id column alone
     __table_args__ = (
         Index('idx_user_timestamp', 'user_id', 'timestamp'),
         Index('idx_session_timestamp', 'session_id', 'timestamp'),
-        Index('idx_message_type', 'message_type'),
-        Index('idx_error_flag', 'error_occurred'),
+        # Errors are rare, so only index the flagged rows
+        Index('idx_error_flag', 'error_occurred', postgresql_where=text("error_occurred = 'Y'")),
     )
     
-    def __init__(self, **kwargs):
-        """Initialize chat history entry with logging"""
-        super().__init__(**kwargs)
-        logger.debug(f"Creating new chat history entry for user {self.user_id}")
-        
-        # Log the creation
-        if hasattr(self, 'message') and self.message:
-            logger.info(f"New chat entry: User {self.user_id} sent {self.message_type} message")
+    # Per-instance state, left unannotated so the declarative mapper ignores it:
+    # parsed meta_data, filled on first get_metadata()
+    _meta_cache = None
+    # Set when _meta_cache was changed in place and must be written back on flush
+    _meta_dirty = False
+    
+    @validates('meta_data')
+    def _reset_meta_cache(self, key: str, value: Optional[str]) -> Optional[str]:
+        """Drop the parsed metadata whenever the column is assigned"""
+        self._meta_cache = None
+        self._meta_dirty = False
+        return value
     
     def set_metadata(self, data: Dict[str, Any]) -> None:
         """Set metadata as JSON string"""
         try:
-            self.meta_data = json.dumps(data, default=str)
-            logger.debug(f"Set metadata for chat entry {self.id}: {data}")
+            self.meta_data = orjson.dumps(data, default=str).decode()
+            logger.debug("Set metadata for chat entry %s: %s", self.id, data)
         except Exception as e:
-            logger.error(f"Failed to set metadata for chat entry {self.id}: {e}")
-            self.meta_data = json.dumps({'error': 'Failed to serialize metadata'})
+            logger.error("Failed to set metadata for chat entry %s: %s", self.id, e)
+            self.meta_data = '{"error":"Failed to serialize metadata"}'
     
     def get_metadata(self) -> Dict[str, Any]:
-        """Get metadata as dictionary"""
-        if not self.meta_data:
-            return {}
-        
-        try:
-            return json.loads(self.meta_data)
-        except Exception as e:
-            logger.error(f"Failed to parse metadata for chat entry {self.id}: {e}")
-            return {'error': 'Failed to parse metadata'}
+        """Get metadata as dictionary, parsed once and cached on the instance"""
+        if self._meta_cache is None:
+            if not self.meta_data:
+                self._meta_cache = {}
+            else:
+                try:
+                    self._meta_cache = orjson.loads(self.meta_data)
+                except orjson.JSONDecodeError as e:
+                    logger.error("Failed to parse metadata for chat entry %s: %s", self.id, e)
+                    return {'error': 'Failed to parse metadata'}
+        return self._meta_cache
     
     def set_response_time(self, response_time_ms: int) -> None:
         """Set response time in milliseconds"""
@@ -79,9 +88,17 @@ class ChatHistory(Base):
         """Mark this entry as having an error"""
         self.error_occurred = 'Y'
         if error_message:
-            current_metadata = self.get_metadata()
-            current_metadata['error_message'] = error_message
-            self.set_metadata(current_metadata)
+            metadata = self.get_metadata()
+            metadata['error_message'] = error_message
+            if 'meta_data' in inspect(self).dict:
+                # Update the cached dict; it is serialized once when the entry is flushed.
+                # Flag the column so the flush visits this row even if no value changed
+                self._meta_cache = metadata
+                self._meta_dirty = True
+                flag_modified(self, 'meta_data')
+            else:
+                # Never set or loaded (e.g. a new entry without metadata): assign it directly
+                self.set_metadata(metadata)
         
         logger.warning(f"Marked chat entry {self.id} as having error: {error_message}")
     
@@ -100,6 +117,36 @@ class ChatHistory(Base):
             'error_occurred': self.error_occurred == 'Y'
         }
     
+    def to_json(self) -> bytes:
+        """
+        Serialize the entry to JSON in a single orjson pass
+        
+        The timestamp is encoded natively by orjson instead of through
+        isoformat(). Stored metadata is embedded as-is when orjson supports
+        fragments, so it is not parsed just to be serialized again.
+        """
+        if self._meta_dirty or self._meta_cache is not None:
+            meta_data = self.get_metadata()
+        elif not self.meta_data:
+            meta_data = {}
+        elif _JSONFragment is not None:
+            meta_data = _JSONFragment(self.meta_data)
+        else:
+            meta_data = self.get_metadata()
+        
+        return orjson.dumps({
+            'id': self.id,
+            'user_id': self.user_id,
+            'session_id': self.session_id,
+            'message': self.message,
+            'response': self.response,
+            'message_type': self.message_type,
+            'timestamp': self.timestamp,
+            'meta_data': meta_data,
+            'response_time': self.response_time,
+            'error_occurred': self.error_occurred == 'Y'
+        }, option=orjson.OPT_NAIVE_UTC)
+    
     def __repr__(self) -> str:
         """String representation"""
         return f"<ChatHistory(id={self.id}, user_id='{self.user_id}', type='{self.message_type}', timestamp='{self.timestamp}')>"
@@ -130,9 +177,28 @@ class ChatHistory(Base):
         if response_time:
             entry.set_response_time(response_time)
         
-        logger.info(f"Created chat history entry {entry.id} for user {user_id}")
+        logger.debug("Created %s chat history entry for user %s", message_type, user_id)
         return entry
     
+    @classmethod
+    def bulk_create(cls, session, entries: List[Dict[str, Any]]) -> None:
+        """
+        Insert many chat history entries in one batch
+        
+        Rows are passed straight to an executemany INSERT, skipping ORM
+        object creation, events and the identity map. meta_data must
+        therefore already be a JSON string.
+        
+        Args:
+            session: SQLAlchemy session to insert with
+            entries: Column name -> value mappings, one per entry
+        """
+        if not entries:
+            return
+        
+        session.bulk_insert_mappings(cls, entries)
+        logger.debug("Bulk inserted %d chat history entries", len(entries))
+    
     @classmethod
     def get_user_history(
         cls,
@@ -177,3 +243,17 @@ class ChatHistory(Base):
         
         # Placeholder implementation
         return 0
+
+@event.listens_for(ChatHistory, 'before_insert')
+@event.listens_for(ChatHistory, 'before_update')
+def _write_pending_metadata(mapper, connection, target: ChatHistory) -> None:
+    """Serialize metadata changed in place (e.g. by mark_error) before it is written"""
+    if target._meta_dirty:
+        target.set_metadata(target._meta_cache)
+
+@event.listens_for(ChatHistory, 'expire')
+def _drop_metadata_cache(target: ChatHistory, attrs) -> None:
+    """Forget the parsed metadata when meta_data is expired, so it is re-read from the row"""
+    if attrs is None or 'meta_data' in attrs:
+        target._meta_cache = None
+        target._meta_dirty = False
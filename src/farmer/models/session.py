@@ -2,11 +2,10 @@
 User session model for tracking user sessions
 """
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, Index, ForeignKey
 from sqlalchemy.orm import relationship
-from typing import Optional
 
-from .chat import Base
+from .base import Base
 from ..config.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -17,8 +16,8 @@ class UserSession(Base):
     __tablename__ = 'user_sessions'
     
     id = Column(Integer, primary_key=True, autoincrement=True)
-    session_id = Column(String(100), unique=True, nullable=False, index=True)
-    user_id = Column(String(50), nullable=False, index=True)
+    session_id = Column(String(100), unique=True, nullable=False)
+    user_id = Column(String(50), ForeignKey('users.user_id'), nullable=False)
     device_info = Column(Text, nullable=True)  # JSON string for device information
     ip_address = Column(String(45), nullable=True)  # IPv4 or IPv6
     user_agent = Column(Text, nullable=True)
@@ -30,6 +29,12 @@ class UserSession(Base):
     # Relationships
     user = relationship("User", back_populates="sessions")
     
+    # The unique constraint already indexes session_id; the composite covers
+    # "active sessions for a user" and lookups on user_id alone
+    __table_args__ = (
+        Index('idx_user_active_lastactivity', 'user_id', 'is_active', 'last_activity'),
+    )
+    
     def __init__(self, **kwargs):
         """Initialize session with logging"""
         super().__init__(**kwargs)
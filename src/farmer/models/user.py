@@ -1,65 +1,281 @@
 """
 User model for storing user information
 """
-from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text
-from sqlalchemy.orm import relationship
-from typing import Optional, List
+import atexit
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from itertools import islice
+from sqlalchemy import JSON, Integer, String, DateTime, Boolean, Index, func, select, update
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column, relationship, object_session
+from typing import Any, Dict, Iterable, Optional, List
+import orjson
 
-from .chat import Base
-from ..config.logging_config import get_logger
+from .base import Base
+from ..config.logging_config import get_logger, MAX_LOG_LEVEL
 
 logger = get_logger(__name__)
 
+# Bound logger methods, saving an attribute lookup on per-row paths
+_debug = logger.debug
+_info = logger.info
+_is_enabled = logger.isEnabledFor
+
+# Rows per batch for User.bulk_create
+BULK_CHUNK_SIZE = 1000
+
+# Batched last_login writes
+LAST_LOGIN_FLUSH_INTERVAL = 5  # seconds
+LAST_LOGIN_BATCH_SIZE = 500
+_login_queue: deque = deque()
+_login_lock = threading.Lock()
+_login_flusher: Optional[threading.Thread] = None
+
+@dataclass(slots=True)
+class UserDTO:
+    """Lightweight read-only view of a user for serialization"""
+    id: int
+    user_id: str
+    username: Optional[str]
+    email: Optional[str]
+    phone: Optional[str]
+    location: Optional[str]
+    language: Optional[str]
+    preferences: Optional[Dict[str, Any]]
+    is_active: Optional[bool]
+    created_at: Optional[datetime]
+    last_login: Optional[datetime]
+
 class User(Base):
     """User model for storing user information"""
     
     __tablename__ = 'users'
     
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    user_id = Column(String(50), unique=True, nullable=False, index=True)
-    username = Column(String(100), nullable=True)
-    email = Column(String(255), nullable=True)
-    phone = Column(String(20), nullable=True)
-    location = Column(String(255), nullable=True)
-    language = Column(String(10), default='en')
-    preferences = Column(Text, nullable=True)  # JSON string for user preferences
-    is_active = Column(Boolean, default=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    last_login = Column(DateTime, nullable=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    user_id: Mapped[str] = mapped_column(String(50), unique=True)
+    username: Mapped[Optional[str]] = mapped_column(String(100))
+    email: Mapped[Optional[str]] = mapped_column(String(255))
+    phone: Mapped[Optional[str]] = mapped_column(String(20))
+    location: Mapped[Optional[str]] = mapped_column(String(255))
+    language: Mapped[Optional[str]] = mapped_column(String(10), default='en')
+    preferences: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSON().with_variant(JSONB(), 'postgresql'))  # User preferences, stored as native JSON
+    is_active: Mapped[Optional[bool]] = mapped_column(Boolean, default=True)
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime, server_default=func.now())
+    last_login: Mapped[Optional[datetime]] = mapped_column(DateTime)
     
     # Relationships
-    chat_history = relationship("ChatHistory", back_populates="user")
-    sessions = relationship("UserSession", back_populates="user")
+    # Lazy loads raise; load these with selectinload()/joinedload() to avoid N+1 queries
+    chat_history = relationship("ChatHistory", back_populates="user", lazy='raise')
+    sessions = relationship("UserSession", back_populates="user", lazy='raise')
     
-    def __init__(self, **kwargs):
-        """Initialize user with logging"""
-        super().__init__(**kwargs)
-        logger.debug(f"Creating new user: {self.user_id}")
+    # The unique constraint already indexes user_id; this one serves
+    # login-recency queries over active users
+    __table_args__ = (
+        Index('ix_users_active_lastlogin', 'is_active', 'last_login'),
+        # Rows are long-lived and rarely read; compressed pages fit ~2x more per buffer-pool page
+        {'mysql_row_format': 'COMPRESSED', 'mysql_key_block_size': 8},
+    )
+    
+    @classmethod
+    def create(cls, **kwargs) -> 'User':
+        """
+        Create a new user and log the registration
+        
+        Use this for actual sign-ups rather than calling User(...) directly,
+        so the registration log isn't tied to plain object construction.
         
-        if hasattr(self, 'username') and self.username:
-            logger.info(f"New user registered: {self.username} ({self.user_id})")
+        Args:
+            **kwargs: Column values for the new user
+        
+        Returns:
+            New, not yet persisted User
+        """
+        user = cls(**kwargs)
+        if user.username:
+            _info("New user registered: %s (%s)", user.username, user.user_id)
+        return user
     
     def update_last_login(self):
-        """Update last login timestamp"""
-        self.last_login = datetime.utcnow()
-        logger.debug(f"Updated last login for user {self.user_id}")
+        """
+        Update last login timestamp
+        
+        While the batch flusher runs (start_last_login_flusher), persistent
+        users are only queued and written in bulk every
+        LAST_LOGIN_FLUSH_INTERVAL seconds; otherwise the database clock is
+        written directly. Both paths stamp the row with the database's now().
+        """
+        session = object_session(self)
+        if _login_flusher is not None and self.id is not None:
+            with _login_lock:
+                _login_queue.append(self.user_id)
+        elif session is not None and self.id is not None:
+            # Persistent user: write straight away instead of waiting for a flush
+            session.execute(update(User).where(User.id == self.id).values(last_login=func.now()))
+            session.expire(self, ['last_login'])
+        else:
+            # New or detached user: a plain value, so to_dict/to_json keep working before a flush
+            self.last_login = datetime.now(timezone.utc).replace(tzinfo=None)
+        if __debug__ and MAX_LOG_LEVEL <= logging.DEBUG and _is_enabled(logging.DEBUG):
+            _debug("Updated last login for user %s", self.user_id)
+    
+    # (attribute, converter applied to non-None values) pairs serialized by to_dict
+    _DICT_FIELDS = (
+        ('id', None),
+        ('user_id', None),
+        ('username', None),
+        ('email', None),
+        ('phone', None),
+        ('location', None),
+        ('language', None),
+        ('preferences', None),
+        ('is_active', None),
+        ('created_at', datetime.isoformat),
+        ('last_login', datetime.isoformat)
+    )
     
     def to_dict(self):
         """Convert model to dictionary"""
-        return {
-            'id': self.id,
-            'user_id': self.user_id,
-            'username': self.username,
-            'email': self.email,
-            'phone': self.phone,
-            'location': self.location,
-            'language': self.language,
-            'preferences': self.preferences,
-            'is_active': self.is_active,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'last_login': self.last_login.isoformat() if self.last_login else None
-        }
+        result = {}
+        for name, convert in self._DICT_FIELDS:
+            value = getattr(self, name)
+            result[name] = convert(value) if convert is not None and value is not None else value
+        return result
+    
+    @classmethod
+    def bulk_create(cls, session, mappings: Iterable[Dict[str, Any]], chunk_size: int = BULK_CHUNK_SIZE) -> int:
+        """
+        Insert many users in fixed-size batches
+        
+        Bulk imports (seeding, migrations) must go through this helper rather
+        than handing one huge list to bulk_insert_mappings: each chunk is
+        flushed before the next is built, which bounds memory and is faster
+        than a single giant batch.
+        
+        Args:
+            session: SQLAlchemy session to insert with
+            mappings: Column name -> value mappings, one per user; may be a generator
+            chunk_size: Rows per INSERT batch
+        
+        Returns:
+            Number of users inserted
+        """
+        rows = iter(mappings)
+        total = 0
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                break
+            session.bulk_insert_mappings(cls, chunk)
+            session.flush()
+            total += len(chunk)
+        
+        if __debug__ and MAX_LOG_LEVEL <= logging.DEBUG and _is_enabled(logging.DEBUG):
+            _debug("Bulk inserted %d users", total)
+        return total
+    
+    @classmethod
+    def fetch_summaries(cls, session, user_ids: Iterable[str]) -> List[Dict[str, Any]]:
+        """
+        Fetch summary fields for several users as plain dicts
+        
+        Selects columns only, so no mapped instances, identity-map entries
+        or attribute state are created; use this for read-only list
+        serialization instead of [u.to_dict() for u in query.all()].
+        
+        Args:
+            session: SQLAlchemy session to query with
+            user_ids: External user IDs to fetch
+        
+        Returns:
+            One dict per matching user
+        """
+        result = session.execute(
+            select(
+                cls.id, cls.user_id, cls.username, cls.language,
+                cls.is_active, cls.created_at, cls.last_login
+            ).where(cls.user_id.in_(user_ids))
+        )
+        keys = tuple(result.keys())
+        return [dict(zip(keys, row)) for row in result]
+    
+    def to_dto(self) -> UserDTO:
+        """Convert model to a slotted UserDTO; timestamps stay datetime objects"""
+        return UserDTO(
+            self.id, self.user_id, self.username, self.email, self.phone, self.location,
+            self.language, self.preferences, self.is_active, self.created_at, self.last_login
+        )
+    
+    def to_json(self) -> bytes:
+        """Serialize the user to JSON in a single orjson pass, without an intermediate dict"""
+        return orjson.dumps(self.to_dto(), option=orjson.OPT_NAIVE_UTC)
     
     def __repr__(self):
         return f"<User(user_id='{self.user_id}', username='{self.username}')>"
+
+def flush_last_logins(session) -> int:
+    """
+    Write queued last_login updates with one UPDATE per batch
+    
+    Rows are stamped with the database clock at flush time, the same
+    source update_last_login uses when writing directly.
+    
+    Args:
+        session: SQLAlchemy session to write with; committed per batch
+    
+    Returns:
+        Number of users updated
+    """
+    total = 0
+    while True:
+        with _login_lock:
+            if not _login_queue:
+                return total
+            count = min(len(_login_queue), LAST_LOGIN_BATCH_SIZE)
+            batch = [_login_queue.popleft() for _ in range(count)]
+        
+        user_ids = set(batch)
+        session.execute(
+            update(User)
+            .where(User.user_id.in_(user_ids))
+            .values(last_login=func.now())
+        )
+        session.commit()
+        total += len(user_ids)
+
+def start_last_login_flusher(app) -> None:
+    """
+    Start batching last_login writes for the app
+    
+    A daemon thread flushes the queue every LAST_LOGIN_FLUSH_INTERVAL
+    seconds inside an app context, and once more at interpreter exit.
+    Only one flusher runs per process: later calls (e.g. further
+    create_app() calls) are no-ops. Disabled via BATCH_LAST_LOGIN in the
+    app config, which TestingConfig turns off.
+    """
+    global _login_flusher
+    
+    from ..core.database import db
+    
+    def flush() -> None:
+        with app.app_context():
+            try:
+                flush_last_logins(db.session)
+            except Exception as e:
+                db.session.rollback()
+                logger.error("Failed to flush last_login updates: %s", e)
+    
+    def run() -> None:
+        while True:
+            time.sleep(LAST_LOGIN_FLUSH_INTERVAL)
+            flush()
+    
+    with _login_lock:
+        if _login_flusher is not None:
+            return
+        _login_flusher = threading.Thread(target=run, name='farmer-last-login', daemon=True)
+        _login_flusher.start()
+        atexit.register(flush)
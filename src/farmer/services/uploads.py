@@ -0,0 +1,76 @@
+"""
+Helpers for forwarding uploaded files to downstream AI services
+"""
+import socket
+import logging
+from typing import Iterator, Optional, Dict, Union
+
+import requests
+
+from ..config.settings import get_config
+
+logger = logging.getLogger(__name__)
+
+# Chunk size used when slicing in-memory payloads
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+def forward_upload(
+    url: str,
+    filepath: str,
+    content_type: str = 'application/octet-stream',
+    headers: Optional[Dict[str, str]] = None
+) -> requests.Response:
+    """
+    Stream a saved upload to a downstream service
+
+    The open file handle is passed straight to requests, so the body is
+    streamed from disk instead of being read into memory first.
+
+    Args:
+        url: Downstream endpoint URL
+        filepath: Path of the saved upload
+        content_type: Content type of the upload
+        headers: Additional request headers
+
+    Returns:
+        Response from the downstream service
+    """
+    request_headers = {'Content-Type': content_type}
+    if headers:
+        request_headers.update(headers)
+
+    with open(filepath, 'rb') as fh:
+        logger.debug("Forwarding upload %s to %s", filepath, url)
+        return requests.post(url, data=fh, headers=request_headers, timeout=get_config().api.timeout)
+
+def iter_chunks(buf: Union[bytes, bytearray, memoryview], chunk_size: int = UPLOAD_CHUNK_SIZE) -> Iterator[memoryview]:
+    """
+    Yield zero-copy chunks of an in-memory payload
+
+    Args:
+        buf: Payload to split
+        chunk_size: Maximum size of each chunk
+
+    Returns:
+        Iterator of memoryview slices over buf
+    """
+    view = memoryview(buf)
+    for offset in range(0, len(view), chunk_size):
+        yield view[offset:offset + chunk_size]
+
+def sendfile_to_socket(sock: socket.socket, filepath: str) -> int:
+    """
+    Send a saved upload over a connected socket
+
+    Uses the kernel sendfile(2) path where available, so file data is not
+    copied through Python.
+
+    Args:
+        sock: Connected socket to write to
+        filepath: Path of the saved upload
+
+    Returns:
+        Number of bytes sent
+    """
+    with open(filepath, 'rb') as fh:
+        return sock.sendfile(fh)
@@ -2,8 +2,6 @@
 Utilities package for Farmer AI Agriculture Assistant.
 """
 
-from .file_utils import *
-
 __all__ = [
     'validate_file',
     'sanitize_filename',
@@ -12,3 +10,12 @@ __all__ = [
     'detect_edges',
     'cleanup_old_files'
 ]
+
+def __getattr__(name):
+    """Import file_utils (and its image dependencies) on first access to one of its helpers"""
+    if name in __all__:
+        from . import file_utils
+        value = getattr(file_utils, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,46 @@
+"""
+Shared fixtures for the Farmer AI Agriculture Assistant tests
+"""
+import os
+import sys
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+# Add src directory to Python path
+sys.path.insert(0, str(Path(__file__).parents[1] / 'src'))
+
+# Settings are read once per process, so set them before farmer is imported
+os.environ.setdefault('OPENAI_API_KEY', 'test-openai-key')
+os.environ.setdefault('HUGGINGFACE_KEY', 'test-huggingface-key')
+os.environ.setdefault('FARMER_FILE_LOG', 'false')
+os.environ.setdefault('FARMER_CONSOLE_LOG', 'false')
+
+@pytest.fixture
+def app(tmp_path, monkeypatch):
+    """Application built from TestingConfig, with its folders under tmp_path"""
+    from farmer.app import create_app
+    
+    monkeypatch.chdir(tmp_path)
+    return create_app('testing', test_config={
+        'TESTING': True,
+        'UPLOAD_FOLDER': str(tmp_path / 'uploads')
+    })
+
+@pytest.fixture
+def client(app):
+    """Test client for the application"""
+    return app.test_client()
+
+@pytest.fixture
+def session():
+    """Session on a fresh in-memory SQLite database with all tables created"""
+    from farmer.models import Base
+    
+    engine = create_engine('sqlite://')
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        yield session
+    engine.dispose()
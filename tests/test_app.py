@@ -0,0 +1,97 @@
+"""
+Smoke tests for the package and the Flask application factory
+"""
+import io
+
+import orjson
+
+def test_package_imports():
+    import farmer
+    import farmer.models
+    
+    assert farmer.__version__
+    assert callable(farmer.create_app)
+    assert farmer.models.User.__tablename__ == 'users'
+
+def test_create_app_uses_named_config(app):
+    from farmer.config.settings import get_config_by_env
+    
+    assert app.config['SQLALCHEMY_DATABASE_URI'] == 'sqlite:///:memory:'
+    # Named configs are built once, so their validate()/get_flask_config() memos are reused
+    assert get_config_by_env('testing') is get_config_by_env('testing')
+
+def test_health(client):
+    assert client.get('/health').status_code == 200
+    
+    response = client.get('/api/v1/health')
+    assert response.status_code == 200
+    assert response.get_json()['status'] == 'healthy'
+
+def test_upload_rejects_disallowed_extension(app, client):
+    upload_dir = app.extensions['upload_dir']
+    
+    response = client.post('/api/v1/upload', data={'file': (io.BytesIO(b'MZ'), 'tool.exe')})
+    assert response.status_code == 400
+    assert list(upload_dir.iterdir()) == []
+
+def test_upload_saves_allowed_file(app, client):
+    upload_dir = app.extensions['upload_dir']
+    
+    response = client.post('/api/v1/upload', data={'file': (io.BytesIO(b'png'), 'leaf.png')})
+    assert response.status_code == 200
+    saved = upload_dir / response.get_json()['saved_as']
+    assert saved.read_bytes() == b'png'
+
+def test_unclaimed_uploads_are_not_kept(app, client):
+    upload_dir = app.extensions['upload_dir']
+    
+    response = client.post('/chat', data={
+        'image': (io.BytesIO(b'a'), 'a.png'),
+        'other': (io.BytesIO(b'b'), 'b.png')
+    })
+    assert response.status_code == 200
+    assert [path.name for path in upload_dir.iterdir()] == [response.get_json()['filename']]
+    
+    # Text messages never claim an attached file
+    response = client.post('/chat', data={'text': 'hello', 'other': (io.BytesIO(b'c'), 'c.png')})
+    assert response.status_code == 200
+    assert len(list(upload_dir.iterdir())) == 1
+
+def test_discard_uploads_removes_saved_files(app):
+    with app.test_request_context(
+        '/api/v1/upload', method='POST', data={'file': (io.BytesIO(b'png'), 'leaf.png')}
+    ) as ctx:
+        path = ctx.request.upload_path(ctx.request.files['file'])
+        assert path.exists()
+        ctx.request.discard_uploads()
+        assert not path.exists()
+
+def test_allowed_upload_uses_dotted_extensions(app):
+    from farmer.app import _allowed_upload
+    
+    with app.app_context():
+        assert _allowed_upload('Leaf.JPG')
+        assert not _allowed_upload('archive.png.exe')
+        assert not _allowed_upload('png')
+
+def test_json_provider_keeps_http_dates(app):
+    from datetime import datetime
+    
+    assert app.json.dumps({'t': datetime(2024, 1, 1)}) == '{"t":"Mon, 01 Jan 2024 00:00:00 GMT"}'
+
+def test_mock_payloads_match_json_provider(client):
+    response = client.get('/crops', query_string={'location': 'Pune', 'soil_type': 'clay'})
+    assert response.status_code == 200
+    data = orjson.loads(response.data)
+    assert list(data) == ['weather', 'recommendations', 'soil_info']
+    assert data['soil_info'] == 'Based on clay soil type in Pune'
+    assert b', ' not in response.data
+    
+    response = client.get('/market')
+    assert '↗️'.encode() in response.data
+
+def test_last_login_flusher_is_off_for_testing(app):
+    from farmer.models import user
+    
+    assert app.config['BATCH_LAST_LOGIN'] is False
+    assert user._login_flusher is None
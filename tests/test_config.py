@@ -0,0 +1,12 @@
+"""
+Tests for configuration loading
+"""
+
+def test_get_config_has_a_single_cache():
+    import farmer
+    from farmer.config import settings
+    
+    assert farmer.get_config is settings.get_config
+    first = farmer.get_config()
+    assert settings.reload_config() is farmer.get_config()
+    assert farmer.get_config() is not first
@@ -0,0 +1,22 @@
+"""
+Tests for the logging helpers
+"""
+import logging
+
+from farmer.config import logging_config
+
+def test_buffer_api_response_skips_disabled_level():
+    logger = logging.getLogger('farmer.tests.access')
+    logger.setLevel(logging.WARNING)
+    logging_config.flush_api_responses()
+    
+    logging_config.buffer_api_response(logger, 'GET', 'index', 200, 0.01)
+    assert not logging_config._access_buffer
+
+def test_api_responses_go_to_access_logger(client, caplog):
+    caplog.set_level(logging.INFO, logger='farmer.access')
+    client.get('/market')
+    logging_config.flush_api_responses()
+    
+    records = [record for record in caplog.records if record.name == 'farmer.access']
+    assert records and 'API Response: GET market' in records[0].getMessage()
@@ -0,0 +1,90 @@
+"""
+Tests for the User and ChatHistory models
+"""
+from datetime import datetime
+
+import orjson
+from sqlalchemy import text
+
+from farmer.models import ChatHistory, User
+from farmer.models import user as user_module
+
+def _add_user(session, user_id='farmer-1'):
+    user = User(user_id=user_id, username='Asha')
+    session.add(user)
+    session.commit()
+    return user
+
+def _stored_metadata(session):
+    return orjson.loads(session.execute(text('SELECT meta_data FROM chat_history')).scalar_one())
+
+def test_mark_error_writes_metadata_on_flush(session):
+    _add_user(session)
+    entry = ChatHistory.create_entry(user_id='farmer-1', message='hi', response='hello', metadata={'lang': 'en'})
+    session.add(entry)
+    session.commit()
+    
+    entry.mark_error('timeout')
+    session.commit()
+    assert entry.error_occurred == 'Y'
+    assert _stored_metadata(session) == {'lang': 'en', 'error_message': 'timeout'}
+    
+    # A second error changes no column value but must still be written
+    entry.mark_error('rate limited')
+    session.commit()
+    assert _stored_metadata(session)['error_message'] == 'rate limited'
+
+def test_mark_error_on_transient_entry_without_metadata(session):
+    _add_user(session)
+    entry = ChatHistory.create_entry(user_id='farmer-1', message='hi', response='hello')
+    entry.mark_error('boom')
+    assert entry.get_metadata() == {'error_message': 'boom'}
+    
+    session.add(entry)
+    session.commit()
+    assert _stored_metadata(session) == {'error_message': 'boom'}
+
+def test_metadata_cache_is_dropped_on_expire(session):
+    _add_user(session)
+    entry = ChatHistory.create_entry(user_id='farmer-1', message='hi', response='hello', metadata={'a': 1})
+    session.add(entry)
+    session.commit()
+    assert entry.get_metadata() == {'a': 1}
+    
+    session.execute(text('UPDATE chat_history SET meta_data = :m'), {'m': '{"a": 2}'})
+    session.commit()
+    assert entry.get_metadata() == {'a': 2}
+
+def test_update_last_login_on_transient_user():
+    user = User.create(user_id='farmer-2')
+    user.update_last_login()
+    
+    assert isinstance(user.last_login, datetime)
+    assert user.to_dict()['last_login'] == user.last_login.isoformat()
+    assert orjson.loads(user.to_json())['user_id'] == 'farmer-2'
+
+def test_update_last_login_on_persistent_user(session):
+    user = _add_user(session)
+    assert user.last_login is None
+    
+    user.update_last_login()
+    session.commit()
+    assert isinstance(user.last_login, datetime)
+
+def test_batched_last_login_uses_database_clock(session, monkeypatch):
+    user = _add_user(session)
+    monkeypatch.setattr(user_module, '_login_flusher', object())
+    
+    user.update_last_login()
+    user.update_last_login()
+    assert list(user_module._login_queue) == ['farmer-1', 'farmer-1']
+    
+    assert user_module.flush_last_logins(session) == 1
+    assert not user_module._login_queue
+    session.refresh(user)
+    assert isinstance(user.last_login, datetime)
+
+def test_email_and_location_fit_long_values():
+    columns = User.__table__.c
+    assert columns.email.type.length >= 254
+    assert columns.location.type.length >= 255